@@ -7,7 +7,7 @@ Watches Claude Code activity and ensures it stays on task using devstral AI.
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -22,7 +22,9 @@ from monitor.models import ClaudeHistoryEvent, InterventionDecision, AnalysisRes
 from monitor.watcher import HistoryMonitor
 from monitor.question_detector import QuestionDetector
 from monitor.question_answerer import QuestionAnswerer, AnswerAttempt
-from monitor.telegram_relay import TelegramRelay
+
+if TYPE_CHECKING:
+    from monitor.telegram_relay import TelegramRelay
 
 
 class Settings(BaseSettings):
@@ -76,9 +78,12 @@ class HawtcherApp:
             confidence_threshold=settings.question_confidence_threshold,
         )
 
-        # Initialize Telegram relay if enabled
-        self.telegram_relay: Optional[TelegramRelay] = None
+        # Initialize Telegram relay if enabled; python-telegram-bot is only
+        # imported when the relay is actually in use
+        self.telegram_relay: Optional["TelegramRelay"] = None
         if settings.enable_telegram_relay and settings.telegram_bot_token:
+            from monitor.telegram_relay import TelegramRelay
+
             self.telegram_relay = TelegramRelay(
                 bot_token=settings.telegram_bot_token,
                 chat_id=settings.telegram_chat_id if settings.telegram_chat_id else None,
@@ -118,25 +123,35 @@ class HawtcherApp:
         Returns:
             The answer to send to Claude Code
         """
-        self.console.print()
-        self.console.print(f"[bold yellow]📨 Claude Code Question Detected[/bold yellow]")
-        self.console.print(f"[cyan]Q: {question}[/cyan]")
-        self.console.print()
+        # Collect lines and render each block with a single print instead of
+        # one render per line
+        lines = [
+            "",
+            "[bold yellow]📨 Claude Code Question Detected[/bold yellow]",
+            f"[cyan]Q: {question}[/cyan]",
+            "",
+        ]
 
         # Display devstral's attempt
         if answer_attempt.answer:
-            self.console.print(f"[dim]devstral's answer ({answer_attempt.confidence:.1%} confident):[/dim]")
-            self.console.print(f"[dim]  {answer_attempt.answer}[/dim]")
-            self.console.print(f"[dim]  Reasoning: {answer_attempt.reasoning}[/dim]")
-            self.console.print()
+            lines += [
+                f"[dim]devstral's answer ({answer_attempt.confidence:.1%} confident):[/dim]",
+                f"[dim]  {answer_attempt.answer}[/dim]",
+                f"[dim]  Reasoning: {answer_attempt.reasoning}[/dim]",
+                "",
+            ]
 
         # Decide whether to use devstral's answer or ask user
         if answer_attempt.should_ask_user:
-            self.console.print(f"[yellow]⚠ Confidence below threshold ({self.settings.question_confidence_threshold:.1%})[/yellow]")
+            lines.append(f"[yellow]⚠ Confidence below threshold ({self.settings.question_confidence_threshold:.1%})[/yellow]")
 
             # Try Telegram if enabled
             if self.telegram_relay:
-                self.console.print("[cyan]Forwarding question to Telegram...[/cyan]")
+                # Flush everything so far before blocking on the user
+                lines.append("[cyan]Forwarding question to Telegram...[/cyan]")
+                self.console.print("\n".join(lines))
+                lines = []
+
                 user_answer = self.telegram_relay.ask_question(
                     question=question,
                     task_description=self.analyzer.user_instruction or "Unknown task",
@@ -145,18 +160,18 @@ class HawtcherApp:
                 )
 
                 if user_answer:
-                    self.console.print(f"[green]✅ Answer received from Telegram: {user_answer}[/green]")
+                    lines.append(f"[green]✅ Answer received from Telegram: {user_answer}[/green]")
                     answer = user_answer
                 else:
-                    self.console.print("[yellow]No response from Telegram, using devstral's answer[/yellow]")
+                    lines.append("[yellow]No response from Telegram, using devstral's answer[/yellow]")
                     answer = answer_attempt.answer or "Please clarify your question."
             else:
                 # No Telegram, use devstral's best guess
-                self.console.print("[yellow]No Telegram relay configured, using devstral's answer[/yellow]")
+                lines.append("[yellow]No Telegram relay configured, using devstral's answer[/yellow]")
                 answer = answer_attempt.answer or "Please clarify your question."
         else:
             # High confidence, use devstral's answer
-            self.console.print(f"[green]✅ Using devstral's answer (high confidence)[/green]")
+            lines.append("[green]✅ Using devstral's answer (high confidence)[/green]")
             answer = answer_attempt.answer
 
         # Send answer to Claude Code via intervention file
@@ -174,8 +189,8 @@ class HawtcherApp:
             )
         )
 
-        self.console.print(f"[bold green]Answer sent to Claude Code[/bold green]")
-        self.console.print()
+        lines += ["[bold green]Answer sent to Claude Code[/bold green]", ""]
+        self.console.print("\n".join(lines))
 
         return answer
 
@@ -311,8 +326,9 @@ class HawtcherApp:
         )
 
         try:
-            # Use polling mode for better compatibility
-            self.monitor.start(use_polling=True)
+            # Event-driven mode (inotify via watchdog); falls back to
+            # polling automatically if the watcher cannot start
+            self.monitor.start()
         except KeyboardInterrupt:
             self.stop()
 
@@ -324,6 +340,8 @@ class HawtcherApp:
         if self.monitor:
             self.monitor.stop()
 
+        self.analyzer.stop()
+
         if self.telegram_relay:
             self.telegram_relay.stop()
 
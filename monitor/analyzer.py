@@ -2,7 +2,9 @@
 Analyzer that maintains context and triggers analysis.
 """
 
-from collections import deque
+import re
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 from monitor.models import (
@@ -21,6 +23,39 @@ class TaskAnalyzer:
     Analyzes Claude Code activity to ensure task adherence.
     """
 
+    # Phrases that warrant immediate analysis (things Claude Code claims to
+    # do but cannot, like monitoring or deferred checks)
+    SUSPICIOUS_PATTERNS = (
+        "i'll monitor",
+        "i will monitor",
+        "i'll check",
+        "i will check",
+        "later on",
+        "in the future",
+        "i'll watch",
+        "i will watch",
+        "i'll track",
+        "i will track",
+        "continuously",
+        "ongoing",
+    )
+
+    # All patterns are literal substrings, so one compiled alternation scans
+    # the text once instead of running a separate search per pattern
+    _SUSPICIOUS_RE = re.compile(
+        "|".join(re.escape(pattern) for pattern in SUSPICIOUS_PATTERNS)
+    )
+
+    _WORD_RE = re.compile(r"[a-z0-9]{4,}")
+
+    # Escalate to the LLM after this many consecutively skipped batches so
+    # slow drift is still caught even when triage keeps passing
+    TRIAGE_ESCALATION_INTERVAL = 3
+
+    # Re-sort the pattern alternation by observed hit counts after this many
+    # matches, so the regex engine tries the likeliest branches first
+    PATTERN_REORDER_INTERVAL = 25
+
     def __init__(
         self,
         llm_client: DevstralClient,
@@ -47,12 +82,26 @@ class TaskAnalyzer:
         )
         self.event_count = 0
         self.check_frequency = 3  # Check every N events
+        self._pending_activities: list[str] = []
+        self._task_vocabulary: set[str] = set()
+        self._skipped_batches = 0
+        self._last_event_normalized: Optional[str] = None
+        self._events_snapshot: Optional[list[ClaudeHistoryEvent]] = None
+        self._suspicious_re = self._SUSPICIOUS_RE
+        self._pattern_hits: Counter[str] = Counter()
+        self._hits_since_reorder = 0
+        # Single worker keeps analyses ordered while letting event ingestion
+        # continue during the LLM round-trip
+        self._analysis_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="hawtcher-analysis"
+        )
 
     def set_user_instruction(self, instruction: str) -> None:
         """Set the current user instruction being worked on."""
         self.user_instruction = instruction
         self.current_todos = []
         self.completed_todos = []
+        self._rebuild_task_vocabulary()
 
     def update_todos(
         self,
@@ -64,6 +113,14 @@ class TaskAnalyzer:
             self.current_todos = current
         if completed is not None:
             self.completed_todos = completed
+        self._rebuild_task_vocabulary()
+
+    def _rebuild_task_vocabulary(self) -> None:
+        """Recompute the word set used by the local triage check."""
+        source = " ".join(
+            [self.user_instruction or ""] + self.current_todos
+        ).lower()
+        self._task_vocabulary = set(self._WORD_RE.findall(source))
 
     def process_event(self, event: ClaudeHistoryEvent) -> None:
         """
@@ -72,90 +129,175 @@ class TaskAnalyzer:
         Args:
             event: New event from history.jsonl
         """
+        # Drop back-to-back duplicates (retries, re-renders of the same
+        # message) before they inflate the context window or the LLM batch
+        normalized = event.display_lower.strip()
+        if normalized == self._last_event_normalized:
+            return
+        self._last_event_normalized = normalized
+
         self.recent_events.append(event)
+        self._events_snapshot = None  # Window changed; invalidate cached view
         self.event_count += 1
 
         # Auto-detect user instructions from events
         if not self.user_instruction:
             self.user_instruction = event.display
+            self._rebuild_task_vocabulary()
 
         # Check if Claude Code is asking a question
         if self.question_detector and self.question_detector.is_question(event.display):
             self._handle_question(event.display)
             return  # Skip other analysis when handling a question
 
-        # Check for suspicious patterns immediately
-        if self._is_suspicious_activity(event.display):
-            self._trigger_analysis(event.display, force=True)
-        # Otherwise check periodically
-        elif self.event_count % self.check_frequency == 0:
-            self._trigger_analysis(event.display)
+        # Buffer activities so bursts share a single LLM round-trip
+        self._pending_activities.append(event.display)
 
-    def _is_suspicious_activity(self, activity: str) -> bool:
+        # Check for suspicious patterns immediately
+        if self._is_suspicious_activity(event.display_lower):
+            self._trigger_analysis(force=True)
+        # Otherwise check once the batch is full, unless cheap local triage
+        # says the whole batch clearly relates to the task
+        elif len(self._pending_activities) >= self.check_frequency:
+            if self._triage_passes():
+                self._pending_activities.clear()
+                self._skipped_batches += 1
+            else:
+                self._trigger_analysis()
+
+    def _is_suspicious_activity(self, activity_lower: str) -> bool:
         """
         Detect patterns that warrant immediate analysis.
 
         Args:
-            activity: The current activity text
+            activity_lower: The current activity text, already lowercased
 
         Returns:
             True if activity looks suspicious
         """
-        suspicious_patterns = [
-            "i'll monitor",
-            "i will monitor",
-            "i'll check",
-            "i will check",
-            "later on",
-            "in the future",
-            "i'll watch",
-            "i will watch",
-            "i'll track",
-            "i will track",
-            "continuously",
-            "ongoing",
-        ]
+        match = self._suspicious_re.search(activity_lower)
+        if match is None:
+            return False
+
+        # Patterns are literals, so the matched text is the pattern itself;
+        # tally it and periodically re-order the alternation by frequency
+        self._pattern_hits[match.group(0)] += 1
+        self._hits_since_reorder += 1
+        if self._hits_since_reorder >= self.PATTERN_REORDER_INTERVAL:
+            self._reorder_suspicious_patterns()
+        return True
+
+    def _reorder_suspicious_patterns(self) -> None:
+        """Recompile the pattern alternation with the most-hit branches first."""
+        ordered = sorted(
+            self.SUSPICIOUS_PATTERNS,
+            key=lambda pattern: self._pattern_hits[pattern],
+            reverse=True,
+        )
+        self._suspicious_re = re.compile(
+            "|".join(re.escape(pattern) for pattern in ordered)
+        )
+        self._hits_since_reorder = 0
 
-        activity_lower = activity.lower()
-        return any(pattern in activity_lower for pattern in suspicious_patterns)
+    def _window_events(self) -> list[ClaudeHistoryEvent]:
+        """
+        Materialized view of the recent-events window.
+
+        The deque is copied at most once per incoming event; analysis and
+        question handling both reuse the cached list instead of building a
+        fresh copy per call.
+        """
+        if self._events_snapshot is None:
+            self._events_snapshot = list(self.recent_events)
+        return self._events_snapshot
 
-    def _trigger_analysis(self, current_activity: str, force: bool = False) -> None:
+    def _triage_passes(self) -> bool:
         """
-        Trigger analysis of current state.
+        Cheap lexical triage for a full batch of pending activities.
+
+        Returns True when every activity shares vocabulary with the user
+        instruction or current todos, meaning an LLM check can be skipped.
+        Every few skipped batches the triage fails on purpose so slow drift
+        still reaches the LLM eventually.
+        """
+        if not self._task_vocabulary:
+            return False
+        if self._skipped_batches >= self.TRIAGE_ESCALATION_INTERVAL:
+            return False
+
+        return all(
+            self._task_vocabulary & set(self._WORD_RE.findall(activity.lower()))
+            for activity in self._pending_activities
+        )
+
+    def _trigger_analysis(self, force: bool = False) -> None:
+        """
+        Queue all pending activities for analysis in a single LLM call.
+
+        The LLM round-trip runs on a background worker so new events can be
+        ingested while the previous batch is still being analyzed.
 
         Args:
-            current_activity: Most recent activity
-            force: Force analysis even if threshold not met
+            force: Force intervention for the triggering activity even if
+                threshold not met
         """
-        if not self.user_instruction:
+        if not self.user_instruction or not self._pending_activities:
             return
 
-        context = TaskContext(
+        activities = self._pending_activities
+        self._pending_activities = []
+        self._skipped_batches = 0
+
+        # model_construct skips re-validation: every field here is already a
+        # validated model or a plain list owned by the analyzer
+        context = TaskContext.model_construct(
             user_instruction=self.user_instruction,
-            recent_events=list(self.recent_events),
+            recent_events=self._window_events(),
             current_todos=self.current_todos,
             completed_todos=self.completed_todos,
         )
 
-        analysis = self.llm_client.analyze_task_adherence(context, current_activity)
+        self._analysis_executor.submit(self._run_analysis, context, activities, force)
 
-        # Determine if intervention is needed
-        should_intervene = (
-            not analysis.is_on_task
-            and analysis.confidence >= self.intervention_threshold
-        ) or force
+    def stop(self) -> None:
+        """
+        Shut down the background analysis worker.
 
-        if should_intervene:
-            severity = self._determine_severity(analysis)
-            intervention = InterventionDecision(
-                should_intervene=True,
-                severity=severity,
-                intervention_message=self._build_intervention_message(analysis),
-                analysis=analysis,
-            )
+        Queued analyses are cancelled so no new LLM calls start after stop.
+        An already in-flight call is not interrupted: the non-daemon worker
+        is still joined at interpreter exit, so shutdown can block for up to
+        the client's read timeout while that call completes.
+        """
+        self._analysis_executor.shutdown(wait=False, cancel_futures=True)
 
-            if self.on_intervention:
-                self.on_intervention(intervention)
+    def _run_analysis(
+        self,
+        context: TaskContext,
+        activities: list[str],
+        force: bool,
+    ) -> None:
+        """Execute the LLM analysis and dispatch interventions (worker thread)."""
+        analyses = self.llm_client.analyze_task_adherence_batch(context, activities)
+
+        for index, analysis in enumerate(analyses):
+            # Determine if intervention is needed; force only applies to the
+            # activity that triggered the flush (the most recent one)
+            should_intervene = (
+                not analysis.is_on_task
+                and analysis.confidence >= self.intervention_threshold
+            ) or (force and index == len(analyses) - 1)
+
+            if should_intervene:
+                severity = self._determine_severity(analysis)
+                intervention = InterventionDecision(
+                    should_intervene=True,
+                    severity=severity,
+                    intervention_message=self._build_intervention_message(analysis),
+                    analysis=analysis,
+                )
+
+                if self.on_intervention:
+                    self.on_intervention(intervention)
 
     def _determine_severity(self, analysis: AnalysisResult) -> str:
         """Determine intervention severity based on analysis."""
@@ -210,9 +352,9 @@ class TaskAnalyzer:
             return
 
         # Build task context
-        task_context = TaskContext(
+        task_context = TaskContext.model_construct(
             user_instruction=self.user_instruction or "Unknown task",
-            recent_events=list(self.recent_events),
+            recent_events=self._window_events(),
             current_todos=self.current_todos,
             completed_todos=self.completed_todos,
         )
@@ -2,11 +2,14 @@
 Intervention system for alerting and correcting Claude Code behavior.
 """
 
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
+from rich.padding import Padding
 from rich.panel import Panel
 from rich.text import Text
 
@@ -16,6 +19,15 @@ from monitor.models import InterventionDecision
 class Interventor:
     """Handles interventions when Claude Code goes off-task."""
 
+    # Built once; severity strings are validated by InterventionDecision, so
+    # lookups here never rebuild the mapping per display
+    SEVERITY_COLORS = {
+        "low": "yellow",
+        "medium": "orange1",
+        "high": "red",
+        "critical": "bright_red",
+    }
+
     def __init__(
         self,
         console: Console,
@@ -26,6 +38,8 @@ class Interventor:
         self.intervention_file = intervention_file
         self.log_path = log_path
         self.intervention_count = 0
+        self._clock_second = -1
+        self._clock_string = ""
 
     def intervene(self, decision: InterventionDecision) -> None:
         """
@@ -49,13 +63,7 @@ class Interventor:
     def _display_intervention(self, decision: InterventionDecision) -> None:
         """Display intervention in the terminal."""
         # Determine color based on severity
-        severity_colors = {
-            "low": "yellow",
-            "medium": "orange1",
-            "high": "red",
-            "critical": "bright_red",
-        }
-        color = severity_colors.get(decision.severity, "yellow")
+        color = self.SEVERITY_COLORS.get(decision.severity, "yellow")
 
         # Create title with severity indicator
         title = Text()
@@ -75,7 +83,7 @@ class Interventor:
             style="dim",
         )
 
-        # Display panel
+        # Display panel with surrounding blank lines in a single render pass
         panel = Panel(
             content,
             title=title,
@@ -83,9 +91,7 @@ class Interventor:
             expand=False,
         )
 
-        self.console.print()
-        self.console.print(panel)
-        self.console.print()
+        self.console.print(Padding(panel, (1, 0)))
 
         # Ring the terminal bell for high severity
         if decision.severity in ["high", "critical"]:
@@ -97,14 +103,20 @@ class Interventor:
             return
 
         try:
+            # Build the record once and append it with a single write, so the
+            # whole entry lands in one buffered call
+            separator = "=" * 80
+            record = (
+                f"\n{separator}\n"
+                f"INTERVENTION #{self.intervention_count}\n"
+                f"Timestamp: {decision.timestamp}\n"
+                f"Severity: {decision.severity}\n"
+                f"Confidence: {decision.analysis.confidence:.1%}\n"
+                f"\n{decision.intervention_message}\n"
+                f"{separator}\n"
+            )
             with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(f"\n{'='*80}\n")
-                f.write(f"INTERVENTION #{self.intervention_count}\n")
-                f.write(f"Timestamp: {decision.timestamp}\n")
-                f.write(f"Severity: {decision.severity}\n")
-                f.write(f"Confidence: {decision.analysis.confidence:.1%}\n")
-                f.write(f"\n{decision.intervention_message}\n")
-                f.write(f"{'='*80}\n")
+                f.write(record)
         except Exception as e:
             self.console.print(f"[red]Failed to log intervention: {e}[/red]")
 
@@ -135,13 +147,18 @@ class Interventor:
 
             message = "\n".join(message_parts)
 
-            # Write to intervention file (atomic write)
-            temp_file = self.intervention_file.with_suffix('.tmp')
-            with open(temp_file, "w", encoding="utf-8") as f:
-                f.write(message)
-
-            # Atomic rename to avoid race conditions
-            temp_file.replace(self.intervention_file)
+            # Atomic write: the hook's test/cat/clear is three separate
+            # operations, so the visible file must never be empty or
+            # half-written. Write the temp file with raw syscalls (one
+            # open, one write) and rename it into place.
+            tmp_path = f"{self.intervention_file}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, message.encode("utf-8"))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.intervention_file)
 
             self.console.print(
                 f"[bold green]Intervention sent to Claude Code via {self.intervention_file}[/bold green]"
@@ -150,14 +167,20 @@ class Interventor:
         except Exception as e:
             self.console.print(f"[red]Failed to write intervention file: {e}[/red]")
 
+    def _clock(self) -> str:
+        """HH:MM:SS for the current time, re-formatted at most once a second."""
+        second = int(time.time())
+        if second != self._clock_second:
+            self._clock_second = second
+            self._clock_string = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._clock_string
+
     def display_status(self, status: str, style: str = "green") -> None:
         """Display a status message."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.console.print(f"[dim]{timestamp}[/dim] [{style}]{status}[/{style}]")
+        self.console.print(f"[dim]{self._clock()}[/dim] [{style}]{status}[/{style}]")
 
     def display_event(self, event_text: str) -> None:
         """Display a Claude Code event."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
         # Truncate long events
         display_text = event_text[:100] + "..." if len(event_text) > 100 else event_text
-        self.console.print(f"[dim]{timestamp}[/dim] [cyan]Event:[/cyan] {display_text}")
+        self.console.print(f"[dim]{self._clock()}[/dim] [cyan]Event:[/cyan] {display_text}")
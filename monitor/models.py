@@ -3,27 +3,44 @@ Pydantic models for Claude Code monitoring.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ClaudeHistoryEvent(BaseModel):
     """Model for a Claude Code history.jsonl entry."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     display: str
-    timestamp: int
+    timestamp: int  # Unix milliseconds, as written by Claude Code
     project: str
     session_id: str = Field(alias="sessionId")
     pasted_contents: Optional[dict[str, Any]] = Field(default=None, alias="pastedContents")
 
-    @field_validator("timestamp")
-    @classmethod
-    def convert_timestamp(cls, v: int) -> datetime:
-        """Convert Unix milliseconds to datetime."""
-        return datetime.fromtimestamp(v / 1000.0)
+    @cached_property
+    def timestamp_dt(self) -> datetime:
+        """Event time as a datetime, converted lazily from Unix milliseconds.
+
+        Most events are only ever pattern-scanned and batched into prompts,
+        so the datetime object is not allocated unless something asks for it.
+        """
+        return datetime.fromtimestamp(self.timestamp / 1000.0)
+
+    @cached_property
+    def display_lower(self) -> str:
+        """Lowercased display text, cached so pattern scans lowercase once."""
+        return self.display.lower()
+
+    @cached_property
+    def history_line(self) -> str:
+        """Formatted recent-history bullet, cached per event.
 
-    class Config:
-        populate_by_name = True
+        Events stay in the sliding window for several prompts, so the
+        truncated line is rendered once instead of on every prompt build.
+        """
+        return f"- {self.display[:150]}"
 
 
 class TaskContext(BaseModel):
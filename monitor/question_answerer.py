@@ -2,15 +2,36 @@
 Question answerer using devstral to attempt answering Claude Code's questions.
 """
 
-import json
 from typing import Optional
 from dataclasses import dataclass
 
-from monitor.llm_client import DevstralClient
+import orjson
+
+from monitor.llm_client import DevstralClient, _extract_json_object
 from monitor.models import TaskContext
 
+# Built once at import time; identical bytes on every call also keep the
+# backend's prompt cache warm
+_SYSTEM_PROMPT = """You are an AI assistant helping to answer questions that Claude Code asks users.
+
+Your job is to analyze the question in the context of the current task and provide:
+1. Your best answer to the question
+2. Your confidence level (0.0 to 1.0) in that answer
+3. Brief reasoning for your answer
+
+If you're not confident in your answer (< 0.95), the question will be forwarded to the human user.
+
+Respond in JSON format:
+{
+  "answer": "Your answer to the question",
+  "confidence": 0.85,
+  "reasoning": "Why you chose this answer and what makes you uncertain"
+}
+
+Be conservative with confidence - only give high confidence (>0.95) if you're very certain based on the task context."""
+
 
-@dataclass
+@dataclass(slots=True)
 class AnswerAttempt:
     """Result of attempting to answer a question."""
     answer: str
@@ -75,24 +96,8 @@ class QuestionAnswerer:
             )
 
     def _build_system_prompt(self) -> str:
-        """Build the system prompt for question answering."""
-        return """You are an AI assistant helping to answer questions that Claude Code asks users.
-
-Your job is to analyze the question in the context of the current task and provide:
-1. Your best answer to the question
-2. Your confidence level (0.0 to 1.0) in that answer
-3. Brief reasoning for your answer
-
-If you're not confident in your answer (< 0.95), the question will be forwarded to the human user.
-
-Respond in JSON format:
-{
-  "answer": "Your answer to the question",
-  "confidence": 0.85,
-  "reasoning": "Why you chose this answer and what makes you uncertain"
-}
-
-Be conservative with confidence - only give high confidence (>0.95) if you're very certain based on the task context."""
+        """Return the (precomputed) system prompt for question answering."""
+        return _SYSTEM_PROMPT
 
     def _build_question_prompt(
         self,
@@ -100,9 +105,15 @@ Be conservative with confidence - only give high confidence (>0.95) if you're ve
         context: TaskContext,
         additional_context: str,
     ) -> str:
-        """Build the prompt with question and context."""
+        """
+        Build the prompt with question and context.
+
+        Stable text (task, todos) leads and all volatile text trails, and
+        per-event timestamps are omitted, so repeat calls share a bytewise
+        identical prefix that the backend's prompt cache can reuse.
+        """
         recent_history = "\n".join(
-            f"- [{event.timestamp}] {event.display[:150]}"
+            event.history_line
             for event in context.recent_events[-5:]
         )
 
@@ -117,10 +128,10 @@ Be conservative with confidence - only give high confidence (>0.95) if you're ve
             context_section = f"\n\nAdditional Context:\n{additional_context}"
 
         return f"""Task: {context.user_instruction}
+{todos_section}
 
 Recent Activity:
 {recent_history}
-{todos_section}
 {context_section}
 
 Claude Code is asking:
@@ -131,14 +142,7 @@ Please provide your answer, confidence level, and reasoning in JSON format."""
     def _parse_answer_response(self, content: str) -> AnswerAttempt:
         """Parse the JSON response from devstral."""
         try:
-            # Try to extract JSON from response
-            content = content.strip()
-            if content.startswith("```json"):
-                content = content.split("```json")[1].split("```")[0]
-            elif content.startswith("```"):
-                content = content.split("```")[1].split("```")[0]
-
-            data = json.loads(content.strip())
+            data = orjson.loads(_extract_json_object(content))
 
             answer = data.get("answer", "")
             confidence = float(data.get("confidence", 0.0))
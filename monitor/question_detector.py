@@ -10,7 +10,7 @@ class QuestionDetector:
     """Detects when Claude Code is asking the user a question."""
 
     # Patterns that indicate Claude is asking for user input
-    QUESTION_PATTERNS = [
+    QUESTION_PATTERNS = (
         r'\?$',  # Ends with question mark
         r'^Should I\b',
         r'^Which\b',
@@ -25,21 +25,27 @@ class QuestionDetector:
         r'\bchoose\b.*\?',
         r'\bprefer\b.*\?',
         r'\bor\b.*\?',  # "Should I do X or Y?"
-    ]
+    )
 
     # Patterns that look like questions but probably aren't user prompts
-    RHETORICAL_PATTERNS = [
+    RHETORICAL_PATTERNS = (
         r'^What (?:is|are|was|were|does|did)',  # "What is this?" (analyzing code)
         r'^How (?:does|did|can|should) (?:this|that|it)',  # "How does this work?" (analyzing)
         r'^Why (?:is|are|does|did)',  # "Why is this failing?"
         r"^Let me (?:check|see|verify|analyze)",  # Planning, not asking
-    ]
-
-    def __init__(self):
-        self.question_patterns = [re.compile(p, re.IGNORECASE | re.MULTILINE)
-                                  for p in self.QUESTION_PATTERNS]
-        self.rhetorical_patterns = [re.compile(p, re.IGNORECASE | re.MULTILINE)
-                                    for p in self.RHETORICAL_PATTERNS]
+    )
+
+    # Each pattern tuple collapses into one alternation compiled once at
+    # class creation, so instances share the regexes and a text is scanned
+    # with two searches instead of one per pattern
+    question_re = re.compile(
+        "|".join(f"(?:{p})" for p in QUESTION_PATTERNS),
+        re.IGNORECASE | re.MULTILINE,
+    )
+    rhetorical_re = re.compile(
+        "|".join(f"(?:{p})" for p in RHETORICAL_PATTERNS),
+        re.IGNORECASE | re.MULTILINE,
+    )
 
     def is_question(self, text: str) -> bool:
         """
@@ -54,17 +60,11 @@ class QuestionDetector:
         if not text or len(text.strip()) == 0:
             return False
 
-        # Check for rhetorical patterns first (exclude these)
-        for pattern in self.rhetorical_patterns:
-            if pattern.search(text):
-                return False
-
-        # Check for question patterns
-        for pattern in self.question_patterns:
-            if pattern.search(text):
-                return True
+        # Rhetorical patterns take precedence (exclude these)
+        if self.rhetorical_re.search(text):
+            return False
 
-        return False
+        return self.question_re.search(text) is not None
 
     def extract_question(self, text: str) -> Optional[str]:
         """
@@ -79,23 +79,19 @@ class QuestionDetector:
         if not self.is_question(text):
             return None
 
-        # Split by newlines and find question sentences
-        lines = text.split('\n')
-        questions = []
-
-        for line in lines:
+        # Single pass over the lines, stopping at the first question; each
+        # line costs at most the two alternation searches
+        for line in text.split('\n'):
             line = line.strip()
-            if self.is_question(line):
-                questions.append(line)
-
-        if not questions:
-            # Fallback: return the whole text if it contains a question mark
-            if '?' in text:
-                return text.strip()
-            return None
-
-        # Return the first significant question
-        return questions[0]
+            if not line or self.rhetorical_re.search(line):
+                continue
+            if self.question_re.search(line):
+                return line
+
+        # Fallback: return the whole text if it contains a question mark
+        if '?' in text:
+            return text.strip()
+        return None
 
     def get_question_context(self, text: str) -> tuple[str, str]:
         """
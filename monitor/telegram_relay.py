@@ -4,24 +4,25 @@ Telegram bot relay for forwarding Claude Code's questions to user.
 
 import asyncio
 import threading
-from typing import Optional, Callable
-from queue import Queue, Empty
+from concurrent.futures import Future, InvalidStateError
+from typing import TYPE_CHECKING, Optional, Callable
 from datetime import datetime
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import (
-    Application,
-    CommandHandler,
-    MessageHandler,
-    CallbackQueryHandler,
-    ContextTypes,
-    filters,
-)
+if TYPE_CHECKING:
+    from telegram import Update
+    from telegram.ext import Application, ContextTypes
 
 
 class TelegramRelay:
     """Relays questions from Claude Code to user via Telegram bot."""
 
+    # Notifications arriving within this window are batched into one message
+    NOTIFICATION_COALESCE_SECONDS = 0.5
+
+    # Telegram rejects messages longer than this; coalesced batches are
+    # split back into multiple sends when they would exceed it
+    TELEGRAM_MESSAGE_LIMIT = 4096
+
     def __init__(
         self,
         bot_token: str,
@@ -32,19 +33,23 @@ class TelegramRelay:
         self.chat_id = chat_id
         self.response_timeout = response_timeout
 
-        # Queue for question/answer coordination
-        self.answer_queue: Queue[str] = Queue()
-        self.waiting_for_answer = False
+        # Pending answer for the in-flight question; a fresh Future per
+        # question means stale answers can never be delivered to a new one
+        self._answer_future: Optional[Future[str]] = None
         self.current_question_id = 0
 
         # Bot application
-        self.app: Optional[Application] = None
+        self.app: Optional["Application"] = None
         self.bot_thread: Optional[threading.Thread] = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Callback for when chat_id is first detected
         self.on_chat_id_detected: Optional[Callable[[str], None]] = None
 
+        # Notification batching state; only touched on the bot loop
+        self._pending_notifications: list[str] = []
+        self._notification_flush_scheduled = False
+
     def start(self):
         """Start the Telegram bot in a background thread."""
         self.bot_thread = threading.Thread(target=self._run_bot, daemon=True)
@@ -52,6 +57,16 @@ class TelegramRelay:
 
     def _run_bot(self):
         """Run the bot in its own event loop."""
+        # python-telegram-bot is imported here, on the bot thread, so the
+        # main thread never pays for it during startup
+        from telegram.ext import (
+            Application,
+            CommandHandler,
+            MessageHandler,
+            CallbackQueryHandler,
+            filters,
+        )
+
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
 
@@ -75,7 +90,7 @@ class TelegramRelay:
         finally:
             self.loop.run_until_complete(self.app.stop())
 
-    async def _handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _handle_start(self, update: "Update", context: "ContextTypes.DEFAULT_TYPE"):
         """Handle /start command."""
         user_chat_id = str(update.effective_chat.id)
 
@@ -97,35 +112,49 @@ class TelegramRelay:
                 "I'll forward questions from Claude Code to you here."
             )
 
-    async def _handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+    def _deliver_answer(self, answer: str) -> bool:
+        """
+        Fulfil the pending answer future.
+
+        Returns:
+            True if a question was waiting and the answer was accepted
+        """
+        future = self._answer_future
+        if future is None:
+            return False
+
+        try:
+            future.set_result(answer)
+        except InvalidStateError:
+            # Already answered or timed out
+            return False
+        return True
+
+    async def _handle_message(self, update: "Update", context: "ContextTypes.DEFAULT_TYPE"):
         """Handle text messages (answers to questions)."""
-        if not self.waiting_for_answer:
+        if not self._deliver_answer(update.message.text):
             await update.message.reply_text(
                 "I'm not currently waiting for an answer. "
                 "I'll send you a question when Claude Code needs input."
             )
             return
 
-        # Put answer in queue
-        self.answer_queue.put(update.message.text)
         await update.message.reply_text("✅ Answer received! Sending to Claude Code...")
 
-    async def _handle_button(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async def _handle_button(self, update: "Update", context: "ContextTypes.DEFAULT_TYPE"):
         """Handle inline keyboard button clicks."""
         query = update.callback_query
         await query.answer()
 
-        if not self.waiting_for_answer:
+        # Extract answer from callback data
+        answer = query.data
+
+        if not self._deliver_answer(answer):
             await query.edit_message_text(
                 "This question has already been answered or timed out."
             )
             return
 
-        # Extract answer from callback data
-        answer = query.data
-
-        # Put answer in queue
-        self.answer_queue.put(answer)
         await query.edit_message_text(
             f"✅ Answer received: {answer}\n\nSending to Claude Code..."
         )
@@ -156,14 +185,8 @@ class TelegramRelay:
             return None
 
         self.current_question_id += 1
-        self.waiting_for_answer = True
-
-        # Clear any old answers from queue
-        while not self.answer_queue.empty():
-            try:
-                self.answer_queue.get_nowait()
-            except Empty:
-                break
+        future: Future[str] = Future()
+        self._answer_future = future
 
         # Send question via Telegram
         asyncio.run_coroutine_threadsafe(
@@ -177,15 +200,14 @@ class TelegramRelay:
             self.loop
         )
 
-        # Wait for answer (blocking)
+        # Wait for answer (blocking); the bot thread fulfils the future
         try:
-            answer = self.answer_queue.get(timeout=self.response_timeout)
-            self.waiting_for_answer = False
-            return answer
-        except Empty:
-            self.waiting_for_answer = False
+            return future.result(timeout=self.response_timeout)
+        except TimeoutError:
             print(f"Timeout waiting for answer from Telegram ({self.response_timeout}s)")
             return None
+        finally:
+            self._answer_future = None
 
     async def _send_question(
         self,
@@ -196,32 +218,30 @@ class TelegramRelay:
         context: Optional[str],
     ):
         """Send question to user via Telegram."""
-        # Build message
-        message_parts = [
-            f"📨 *Claude Code Question #{self.current_question_id}*",
-            "━━━━━━━━━━━━━━━━━━━━━",
-            f"*Task:* {task_description[:100]}",
-            "",
-            f"*Question:*\n{question}",
-        ]
-
-        if context:
-            message_parts.append(f"\n*Context:*\n{context[:200]}")
+        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+        # Build the optional sections, then render the whole message with a
+        # single format instead of list appends plus a join
+        context_section = f"\n\n*Context:*\n{context[:200]}" if context else ""
 
+        suggestion_section = ""
         if devstral_suggestion:
             confidence_pct = f"{devstral_confidence * 100:.0f}%" if devstral_confidence else "?"
-            message_parts.extend([
-                "",
-                f"*devstral's suggestion ({confidence_pct} confident):*",
-                f"_{devstral_suggestion[:150]}_",
-            ])
-
-        message_parts.extend([
-            "",
-            "💬 *Your answer:*",
-        ])
+            suggestion_section = (
+                f"\n\n*devstral's suggestion ({confidence_pct} confident):*"
+                f"\n_{devstral_suggestion[:150]}_"
+            )
 
-        message_text = "\n".join(message_parts)
+        message_text = (
+            f"📨 *Claude Code Question #{self.current_question_id}*\n"
+            "━━━━━━━━━━━━━━━━━━━━━\n"
+            f"*Task:* {task_description[:100]}\n"
+            "\n"
+            f"*Question:*\n{question}"
+            f"{context_section}"
+            f"{suggestion_section}"
+            "\n\n💬 *Your answer:*"
+        )
 
         # Build inline keyboard
         keyboard = []
@@ -248,26 +268,62 @@ class TelegramRelay:
             reply_markup=reply_markup,
         )
 
-    async def _send_notification_async(self, message: str):
-        """Send a fire-and-forget notification."""
-        if not self.chat_id:
+    def _queue_notification(self, message: str):
+        """Buffer a notification and schedule a flush (runs on the bot loop)."""
+        self._pending_notifications.append(message)
+        if not self._notification_flush_scheduled:
+            self._notification_flush_scheduled = True
+            self.loop.call_later(
+                self.NOTIFICATION_COALESCE_SECONDS,
+                lambda: self.loop.create_task(self._flush_notifications()),
+            )
+
+    async def _flush_notifications(self):
+        """Send all buffered notifications in as few messages as fit."""
+        self._notification_flush_scheduled = False
+        messages = self._pending_notifications
+        self._pending_notifications = []
+
+        if not messages or not self.chat_id:
             return
 
-        await self.app.bot.send_message(
-            chat_id=self.chat_id,
-            text=message,
-            parse_mode="Markdown",
-        )
+        # Pack the batch into chunks under Telegram's message length limit;
+        # a single oversized notification is hard-split
+        limit = self.TELEGRAM_MESSAGE_LIMIT
+        chunks: list[str] = []
+        current = ""
+        for message in messages:
+            candidate = f"{current}\n\n{message}" if current else message
+            if len(candidate) <= limit:
+                current = candidate
+                continue
+            if current:
+                chunks.append(current)
+            while len(message) > limit:
+                chunks.append(message[:limit])
+                message = message[limit:]
+            current = message
+        if current:
+            chunks.append(current)
+
+        for chunk in chunks:
+            await self.app.bot.send_message(
+                chat_id=self.chat_id,
+                text=chunk,
+                parse_mode="Markdown",
+            )
 
     def send_notification(self, message: str):
-        """Send a notification without expecting a response."""
+        """
+        Send a notification without expecting a response.
+
+        Rapid successive calls are coalesced into a single Telegram message
+        so bursts don't trip the Bot API rate limit or spam the chat.
+        """
         if not self.loop or not self.app:
             return
 
-        asyncio.run_coroutine_threadsafe(
-            self._send_notification_async(message),
-            self.loop
-        )
+        self.loop.call_soon_threadsafe(self._queue_notification, message)
 
     def stop(self):
         """Stop the Telegram bot."""
@@ -2,13 +2,19 @@
 File watcher for Claude Code history.jsonl
 """
 
-import json
+import os
+import sys
+import threading
 import time
 from pathlib import Path
-from typing import Callable, Optional
-from watchdog.observers import Observer
+from typing import TYPE_CHECKING, BinaryIO, Callable, Optional
+
+import orjson
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent
 
+if TYPE_CHECKING:
+    from watchdog.observers import Observer
+
 from monitor.models import ClaudeHistoryEvent
 
 
@@ -23,6 +29,7 @@ class HistoryWatcher(FileSystemEventHandler):
         self.history_path = history_path
         self.on_new_event = on_new_event
         self.last_position = 0
+        self._file: Optional[BinaryIO] = None
         self._initialize_position()
 
     def _initialize_position(self) -> None:
@@ -39,26 +46,72 @@ class HistoryWatcher(FileSystemEventHandler):
 
         self._read_new_entries()
 
+    def close(self) -> None:
+        """Release the persistent file handle."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
     def _read_new_entries(self) -> None:
         """Read and parse new entries from the history file."""
-        if not self.history_path.exists():
+        # A stat is far cheaper than an open; skip the whole read when the
+        # file hasn't grown (the common case for polling and coalesced events)
+        try:
+            stat = os.stat(self.history_path)
+        except OSError:
+            self.close()
+            return
+
+        if stat.st_size == self.last_position:
             return
+        if stat.st_size < self.last_position:
+            # File was truncated or rotated; start over from the beginning
+            self.last_position = 0
+            self.close()
+
+        # Reuse one open handle across reads; reopen only if the path now
+        # points at a different inode (log rotation). A rotated file is a
+        # new file, so the read position starts over from the beginning
+        if self._file is not None:
+            try:
+                if os.fstat(self._file.fileno()).st_ino != stat.st_ino:
+                    self.close()
+                    self.last_position = 0
+            except OSError:
+                self.close()
+                self.last_position = 0
+
+        if self._file is None:
+            try:
+                self._file = open(self.history_path, "rb")
+            except OSError:
+                return
+
+        self._file.seek(self.last_position)
+        chunk = self._file.read()
 
-        with open(self.history_path, "r", encoding="utf-8") as f:
-            f.seek(self.last_position)
-            new_lines = f.readlines()
-            self.last_position = f.tell()
+        if not chunk:
+            return
+
+        # Only consume up to the last newline; a partially-written trailing
+        # line stays unconsumed until the writer finishes it
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            return
+        self.last_position += end + 1
 
-        for line in new_lines:
+        for line in chunk[:end].split(b"\n"):
             line = line.strip()
             if not line:
                 continue
 
             try:
-                data = json.loads(line)
+                # orjson decodes the raw bytes directly; pydantic still
+                # validates the untrusted fields
+                data = orjson.loads(line)
                 event = ClaudeHistoryEvent(**data)
                 self.on_new_event(event)
-            except (json.JSONDecodeError, ValueError) as e:
+            except ValueError as e:  # orjson.JSONDecodeError subclasses this
                 print(f"Error parsing history entry: {e}")
                 continue
 
@@ -78,21 +131,59 @@ class HistoryMonitor:
     ):
         self.history_path = Path(history_path).expanduser()
         self.watcher = HistoryWatcher(self.history_path, on_new_event)
-        self.observer: Optional[Observer] = None
+        self.observer: Optional["Observer"] = None
         self.poll_interval = poll_interval
         self._running = False
+        self._stop_event = threading.Event()
 
     def start(self, use_polling: bool = False) -> None:
-        """Start monitoring the history file."""
+        """
+        Start monitoring the history file.
+
+        Observer mode sleeps until the kernel reports a file change (inotify
+        on Linux); polling mode remains as a fallback for filesystems without
+        change notification. If the observer cannot start, polling is used
+        automatically.
+        """
         self._running = True
+        self._stop_event.clear()
 
         if use_polling:
             self._run_polling_mode()
-        else:
+            return
+
+        try:
             self._run_observer_mode()
+        except OSError as e:
+            print(f"File watcher unavailable ({e}), falling back to polling")
+            self._run_polling_mode()
 
     def _run_observer_mode(self) -> None:
         """Use watchdog observer for file system events."""
+        # Prefer the inotify backend explicitly on Linux: watchdog's
+        # auto-selection can fall back to kernel polling on unusual
+        # platforms, and inotify is what makes event delivery effectively
+        # free between writes. Elsewhere (macOS FSEvents, BSD kqueue), and
+        # on libcs without inotify, use watchdog's auto-selected native
+        # backend — the inotify import raises UnsupportedLibcError (a plain
+        # Exception, not ImportError) on unsupported systems
+        Observer = None
+        if sys.platform == "linux":
+            try:
+                from watchdog.utils import UnsupportedLibcError
+
+                try:
+                    from watchdog.observers.inotify import (
+                        InotifyObserver as Observer,
+                    )
+                except UnsupportedLibcError:
+                    pass
+            except ImportError:
+                pass
+
+        if Observer is None:
+            from watchdog.observers import Observer
+
         self.observer = Observer()
         self.observer.schedule(
             self.watcher,
@@ -101,24 +192,36 @@ class HistoryMonitor:
         )
         self.observer.start()
 
+        # Catch up on anything written between startup and the first event
+        self.watcher.force_check()
+
         try:
-            while self._running:
-                time.sleep(1)
+            # Block until stop() is called; the observer thread delivers
+            # events, so there is no need to wake up on a timer
+            self._stop_event.wait()
         except KeyboardInterrupt:
             self.stop()
 
     def _run_polling_mode(self) -> None:
         """Poll the file periodically for changes."""
+        # Bind loop invariants to locals; attribute lookups add up in a loop
+        # that runs for the lifetime of the process
+        force_check = self.watcher.force_check
+        sleep = time.sleep
+        poll_interval = self.poll_interval
+
         try:
             while self._running:
-                self.watcher.force_check()
-                time.sleep(self.poll_interval)
+                force_check()
+                sleep(poll_interval)
         except KeyboardInterrupt:
             self.stop()
 
     def stop(self) -> None:
         """Stop monitoring."""
         self._running = False
+        self._stop_event.set()
         if self.observer:
             self.observer.stop()
             self.observer.join()
+        self.watcher.close()
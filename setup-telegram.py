@@ -3,6 +3,8 @@
 Telegram bot setup helper for Hawtcher.
 """
 
+import os
+import re
 import sys
 from pathlib import Path
 
@@ -12,48 +14,61 @@ from rich.prompt import Prompt, Confirm
 
 console = Console()
 
+# Bot tokens look like "123456789:ABC-DEF..." — numeric bot ID, a colon,
+# then a 35-character secret. Checking the shape up front avoids paying a
+# full Application build + async teardown just to discover a typo
+_TOKEN_RE = re.compile(r"\d{6,12}:[A-Za-z0-9_-]{30,}")
+
+# Fixed banner text, built once at module load
+_BANNER = """[bold green]Hawtcher Telegram Setup[/bold green]
+
+This will help you set up Telegram notifications for Claude Code questions.
+"""
+
+
+def prompt_token() -> str:
+    """Prompt for the bot token until it matches the expected shape."""
+    while True:
+        token = Prompt.ask("[green]Paste your bot token here[/green]").strip()
+        if _TOKEN_RE.fullmatch(token):
+            return token
+        console.print("[red]Invalid bot token format, try again[/red]")
+
 
 def main():
     """Interactive Telegram bot setup."""
     console.clear()
 
-    # Display banner
-    banner_text = """[bold green]Hawtcher Telegram Setup[/bold green]
-
-This will help you set up Telegram notifications for Claude Code questions.
-"""
-    console.print(Panel(banner_text, expand=False))
+    console.print(Panel(_BANNER, expand=False))
     console.print()
 
-    # Step 1: Instructions for creating bot
-    console.print("[bold cyan]Step 1: Create a Telegram Bot[/bold cyan]")
-    console.print()
-    console.print("1. Open Telegram and search for @BotFather")
-    console.print("2. Send the command: /newbot")
-    console.print("3. Follow the prompts to name your bot")
-    console.print("4. Copy the bot token (long string like: 123456:ABC-DEF...)")
-    console.print()
+    # Step 1: Instructions for creating bot (one render per block, not one
+    # per line)
+    console.print(
+        "[bold cyan]Step 1: Create a Telegram Bot[/bold cyan]\n"
+        "\n"
+        "1. Open Telegram and search for @BotFather\n"
+        "2. Send the command: /newbot\n"
+        "3. Follow the prompts to name your bot\n"
+        "4. Copy the bot token (long string like: 123456:ABC-DEF...)\n"
+    )
 
     if not Confirm.ask("Have you created your bot and have the token?"):
         console.print("[yellow]Please create a bot first, then run this script again.[/yellow]")
         return
 
-    # Get bot token
+    # Get bot token; retries inline instead of bailing out of the script
     console.print()
-    bot_token = Prompt.ask("[green]Paste your bot token here[/green]").strip()
-
-    if not bot_token or ":" not in bot_token:
-        console.print("[red]Invalid bot token format[/red]")
-        return
+    bot_token = prompt_token()
 
     # Step 2: Get chat ID
-    console.print()
-    console.print("[bold cyan]Step 2: Get Your Chat ID[/bold cyan]")
-    console.print()
-    console.print("Your chat ID will be detected automatically when you send /start to your bot.")
-    console.print()
-    console.print("We'll start a temporary bot listener...")
-    console.print()
+    console.print(
+        "\n[bold cyan]Step 2: Get Your Chat ID[/bold cyan]\n"
+        "\n"
+        "Your chat ID will be detected automatically when you send /start to your bot.\n"
+        "\n"
+        "We'll start a temporary bot listener...\n"
+    )
 
     # Try to start bot and detect chat ID
     try:
@@ -62,6 +77,7 @@ This will help you set up Telegram notifications for Claude Code questions.
         from telegram.ext import Application, CommandHandler, ContextTypes
 
         detected_chat_id = None
+        chat_id_detected = asyncio.Event()
 
         async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             nonlocal detected_chat_id
@@ -70,31 +86,43 @@ This will help you set up Telegram notifications for Claude Code questions.
                 "✅ Connected! Your chat ID has been detected.\n\n"
                 "You can now close this and configure Hawtcher."
             )
-            # Stop the application
-            await context.application.stop()
+            chat_id_detected.set()
 
         async def run_bot():
             app = Application.builder().token(bot_token).build()
             app.add_handler(CommandHandler("start", start_handler))
 
-            console.print("[yellow]Waiting for you to send /start to your bot...[/yellow]")
-            console.print("[dim](Open Telegram, find your bot, and send /start)[/dim]")
-            console.print()
+            console.print(
+                "[yellow]Waiting for you to send /start to your bot...[/yellow]\n"
+                "[dim](Open Telegram, find your bot, and send /start)[/dim]\n"
+            )
 
             await app.initialize()
             await app.start()
-            await app.updater.start_polling()
+            # Short-polling tuning for a one-shot handshake: pick up the
+            # /start quickly and don't replay updates from before this run
+            await app.updater.start_polling(
+                poll_interval=0.2,
+                timeout=5,
+                bootstrap_retries=0,
+                drop_pending_updates=True,
+            )
 
-            # Wait for chat ID detection (max 60 seconds)
-            for _ in range(60):
-                if detected_chat_id:
-                    break
-                await asyncio.sleep(1)
+            # Sleep until the handler signals detection (max 60 seconds);
+            # no wake-up-and-check loop
+            try:
+                await asyncio.wait_for(chat_id_detected.wait(), timeout=60)
+            except asyncio.TimeoutError:
+                pass
 
             await app.stop()
             return detected_chat_id
 
-        chat_id = asyncio.run(run_bot())
+        # One Runner means one event loop even if retry logic is added
+        # around run_bot later; asyncio.run would rebuild the loop (and
+        # reinstall signal handlers) on every attempt
+        with asyncio.Runner() as runner:
+            chat_id = runner.run(run_bot())
 
         if not chat_id:
             console.print()
@@ -107,51 +135,65 @@ This will help you set up Telegram notifications for Claude Code questions.
         chat_id = ""
 
     # Step 3: Update .env file
-    console.print()
-    console.print("[bold cyan]Step 3: Update Configuration[/bold cyan]")
-    console.print()
+    console.print("\n[bold cyan]Step 3: Update Configuration[/bold cyan]\n")
 
     env_path = Path(".env")
     env_example_path = Path(".env.example")
 
-    # Create .env from .env.example if it doesn't exist
-    if not env_path.exists() and env_example_path.exists():
-        console.print("Creating .env file from .env.example...")
-        env_path.write_text(env_example_path.read_text())
-
-    if env_path.exists():
+    # EAFP: read .env directly and fall back to the template on
+    # FileNotFoundError, rather than stat-ing paths first. This avoids the
+    # exists/read race and means .env is written at most once, below
+    from_template = False
+    try:
         env_content = env_path.read_text()
-
-        # Update or add Telegram settings
+    except FileNotFoundError:
+        try:
+            env_content = env_example_path.read_text()
+            from_template = True
+            console.print("Creating .env file from .env.example...")
+        except FileNotFoundError:
+            env_content = None
+
+    if env_content is not None:
+        # Index existing assignments by key once, then update or append each
+        # setting with a dict lookup instead of re-scanning the lines
         lines = env_content.split("\n")
-        new_lines = []
-        found_token = False
-        found_chat_id = False
-        found_enabled = False
-
-        for line in lines:
-            if line.startswith("TELEGRAM_BOT_TOKEN="):
-                new_lines.append(f"TELEGRAM_BOT_TOKEN={bot_token}")
-                found_token = True
-            elif line.startswith("TELEGRAM_CHAT_ID="):
-                new_lines.append(f"TELEGRAM_CHAT_ID={chat_id}")
-                found_chat_id = True
-            elif line.startswith("ENABLE_TELEGRAM_RELAY="):
-                new_lines.append("ENABLE_TELEGRAM_RELAY=true")
-                found_enabled = True
+        key_to_index = {
+            line.split("=", 1)[0]: i
+            for i, line in enumerate(lines)
+            if "=" in line and not line.lstrip().startswith("#")
+        }
+
+        updates = {
+            "TELEGRAM_BOT_TOKEN": f"TELEGRAM_BOT_TOKEN={bot_token}",
+            "TELEGRAM_CHAT_ID": f"TELEGRAM_CHAT_ID={chat_id}",
+            "ENABLE_TELEGRAM_RELAY": "ENABLE_TELEGRAM_RELAY=true",
+        }
+
+        for key, assignment in updates.items():
+            index = key_to_index.get(key)
+            if index is None:
+                lines.append(assignment)
             else:
-                new_lines.append(line)
-
-        # Add missing settings
-        if not found_token:
-            new_lines.append(f"TELEGRAM_BOT_TOKEN={bot_token}")
-        if not found_chat_id:
-            new_lines.append(f"TELEGRAM_CHAT_ID={chat_id}")
-        if not found_enabled:
-            new_lines.append("ENABLE_TELEGRAM_RELAY=true")
-
-        env_path.write_text("\n".join(new_lines))
-        console.print("[green]✅ .env file updated[/green]")
+                lines[index] = assignment
+
+        # Skip the write (and the resulting mtime churn) when every setting
+        # already has the desired value
+        new_content = "\n".join(lines)
+        if from_template or new_content != env_content:
+            # .env now holds the bot token, so create it 0o600 and swap it
+            # into place atomically (temp file + rename, as the interventor
+            # does for its shared file)
+            tmp_path = env_path.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, new_content.encode("utf-8"))
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, env_path)
+            console.print("[green]✅ .env file updated[/green]")
+        else:
+            console.print("[green]✅ .env file already up to date[/green]")
     else:
         console.print("[yellow]No .env file found. Please create one manually.[/yellow]")
 
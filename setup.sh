@@ -33,6 +33,12 @@ pip install --upgrade pip
 pip install -r requirements.txt
 echo ""
 
+# Precompile scripts and the monitor package so first launch skips the
+# parse/compile step (the bulk of startup for these short CLI scripts)
+echo "Precompiling bytecode..."
+python -m compileall -q monitor hawtcher.py setup-telegram.py test-hawtcher.py
+echo ""
+
 # Create .env if it doesn't exist
 if [ ! -f ".env" ]; then
     echo "Creating .env file..."
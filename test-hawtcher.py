@@ -4,45 +4,49 @@ Test script for Hawtcher - verifies LM Studio and intervention system
 without needing Claude Code hook installed.
 """
 
+import argparse
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 
-from monitor.llm_client import DevstralClient
-from monitor.models import TaskContext, ClaudeHistoryEvent, InterventionDecision
-from monitor.interventor import Interventor
-from monitor.question_detector import QuestionDetector
-from monitor.question_answerer import QuestionAnswerer
+# The monitor modules (and pydantic/openai behind them) are imported inside
+# the tests that need them, so the header and prompts appear immediately
+if TYPE_CHECKING:
+    from monitor.llm_client import DevstralClient
 
 # Load environment
 load_dotenv()
 
 console = Console()
 
+# Fixed header text, built once at module load
+_HEADER = (
+    "[bold green]Hawtcher Test Suite[/bold green]\n"
+    "Testing devstral integration without Claude Code hook"
+)
+
 
 def print_header():
     """Print test header."""
     console.print()
-    console.print(Panel(
-        "[bold green]Hawtcher Test Suite[/bold green]\n"
-        "Testing devstral integration without Claude Code hook",
-        expand=False
-    ))
+    console.print(Panel(_HEADER, expand=False))
     console.print()
 
 
-def test_lm_studio_connection(base_url: str, model: str) -> bool:
+def test_lm_studio_connection(client: "DevstralClient", model: str) -> bool:
     """Test connection to LM Studio."""
     console.print("[yellow]1. Testing LM Studio connection...[/yellow]")
 
-    try:
-        client = DevstralClient(base_url, model)
+    from monitor.models import TaskContext
 
+    try:
         # Simple test
         test_context = TaskContext(
             user_instruction="Test task",
@@ -65,23 +69,24 @@ def test_lm_studio_connection(base_url: str, model: str) -> bool:
         return False
 
 
-def test_off_task_detection(client: DevstralClient) -> bool:
-    """Test that devstral can detect off-task behavior."""
-    console.print("\n[yellow]2. Testing off-task detection...[/yellow]")
+def start_off_task_detection(client: "DevstralClient", pool: ThreadPoolExecutor):
+    """Build the off-task scenario and submit its LLM call in the background."""
+    from monitor.models import TaskContext, ClaudeHistoryEvent
 
     # Create a scenario where Claude Code goes off-task
+    now_ms = time.time_ns() // 1_000_000
     context = TaskContext(
         user_instruction="Implement a user authentication system with JWT tokens",
         recent_events=[
             ClaudeHistoryEvent(
                 display="I'll start implementing the authentication",
-                timestamp=int(datetime.now().timestamp() * 1000),
+                timestamp=now_ms,
                 project="/test/project",
                 sessionId="test-session",
             ),
             ClaudeHistoryEvent(
                 display="Let me research authentication best practices",
-                timestamp=int(datetime.now().timestamp() * 1000),
+                timestamp=now_ms,
                 project="/test/project",
                 sessionId="test-session",
             ),
@@ -92,12 +97,20 @@ def test_off_task_detection(client: DevstralClient) -> bool:
     # This should trigger an intervention
     off_task_activity = "I'll monitor the authentication implementation and check back later"
 
+    future = pool.submit(client.analyze_task_adherence, context, off_task_activity)
+    return context, off_task_activity, future
+
+
+def test_off_task_detection(context, off_task_activity, future) -> bool:
+    """Test that devstral can detect off-task behavior."""
+    console.print("\n[yellow]2. Testing off-task detection...[/yellow]")
+
     console.print(f"  User task: [cyan]{context.user_instruction}[/cyan]")
     console.print(f"  Claude says: [yellow]{off_task_activity}[/yellow]")
     console.print("  Analyzing with devstral...")
 
     try:
-        result = client.analyze_task_adherence(context, off_task_activity)
+        result = future.result()
 
         console.print(f"\n  [bold]Analysis Result:[/bold]")
         console.print(f"    On task: {result.is_on_task}")
@@ -125,6 +138,9 @@ def test_intervention_writing(intervention_file: Path) -> bool:
     """Test writing intervention files."""
     console.print("\n[yellow]3. Testing intervention file writing...[/yellow]")
 
+    from monitor.interventor import Interventor
+    from monitor.models import InterventionDecision
+
     try:
         interventor = Interventor(
             console=console,
@@ -174,6 +190,8 @@ def test_question_detection() -> bool:
     """Test question detection patterns."""
     console.print("\n[yellow]4. Testing question detection...[/yellow]")
 
+    from monitor.question_detector import QuestionDetector
+
     detector = QuestionDetector()
 
     test_cases = [
@@ -208,9 +226,10 @@ def test_question_detection() -> bool:
         return False
 
 
-def test_question_answering(client: DevstralClient) -> bool:
-    """Test question answering with devstral."""
-    console.print("\n[yellow]5. Testing question answering...[/yellow]")
+def start_question_answering(client: "DevstralClient", pool: ThreadPoolExecutor):
+    """Build the question-answering scenario and submit its LLM call."""
+    from monitor.question_answerer import QuestionAnswerer
+    from monitor.models import TaskContext
 
     answerer = QuestionAnswerer(client, confidence_threshold=0.95)
 
@@ -222,11 +241,19 @@ def test_question_answering(client: DevstralClient) -> bool:
 
     question = "Should I use JWT tokens or session-based authentication?"
 
+    future = pool.submit(answerer.try_answer, question, context)
+    return question, future
+
+
+def test_question_answering(question, future) -> bool:
+    """Test question answering with devstral."""
+    console.print("\n[yellow]5. Testing question answering...[/yellow]")
+
     console.print(f"  Question: [cyan]{question}[/cyan]")
     console.print("  Asking devstral...")
 
     try:
-        answer_attempt = answerer.try_answer(question, context)
+        answer_attempt = future.result()
 
         console.print(f"\n  [bold]Answer Attempt:[/bold]")
         console.print(f"    Answer: {answer_attempt.answer}")
@@ -246,7 +273,7 @@ def test_question_answering(client: DevstralClient) -> bool:
         return False
 
 
-def test_real_scenario(client: DevstralClient, intervention_file: Path):
+def test_real_scenario(client: "DevstralClient", intervention_file: Path):
     """Run a full test scenario."""
     console.print("\n[yellow]6. Full scenario test (optional)[/yellow]")
 
@@ -267,6 +294,8 @@ def test_real_scenario(client: DevstralClient, intervention_file: Path):
     )
 
     # Analyze
+    from monitor.models import TaskContext
+
     context = TaskContext(
         user_instruction=task,
         recent_events=[],
@@ -285,6 +314,9 @@ def test_real_scenario(client: DevstralClient, intervention_file: Path):
         console.print("\n[red]OFF-TASK DETECTED![/red]")
         console.print("\n[bold]Intervention would be sent:[/bold]")
 
+        from monitor.interventor import Interventor
+        from monitor.models import InterventionDecision
+
         interventor = Interventor(console, intervention_file)
         decision = InterventionDecision(
             should_intervene=True,
@@ -305,6 +337,19 @@ def test_real_scenario(client: DevstralClient, intervention_file: Path):
 
 def main():
     """Run all tests."""
+    parser = argparse.ArgumentParser(description="Hawtcher test suite")
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="only check the LM Studio connection (skips the slower LLM tests)",
+    )
+    parser.add_argument(
+        "--no-scenario",
+        action="store_true",
+        help="skip the interactive full-scenario test",
+    )
+    args = parser.parse_args()
+
     print_header()
 
     # Get configuration
@@ -330,29 +375,44 @@ def main():
     # Run tests
     results = []
 
-    # Test 1: Connection
+    # Test 1: Connection (the same client, and its connection pool, is
+    # reused by every later test)
     client = DevstralClient(base_url, model)
-    results.append(("LM Studio Connection", test_lm_studio_connection(base_url, model)))
+    results.append(("LM Studio Connection", test_lm_studio_connection(client, model)))
 
     if not results[0][1]:
         console.print("\n[red]Cannot continue - LM Studio not connected[/red]")
         console.print("[yellow]Make sure LM Studio is running with devstral loaded[/yellow]")
         return 1
 
-    # Test 2: Detection
-    results.append(("Off-task Detection", test_off_task_detection(client)))
-
-    # Test 3: File writing
-    results.append(("Intervention Writing", test_intervention_writing(intervention_file)))
-
-    # Test 4: Question detection
-    results.append(("Question Detection", test_question_detection()))
-
-    # Test 5: Question answering
-    results.append(("Question Answering", test_question_answering(client)))
-
-    # Test 6: Real scenario
-    test_real_scenario(client, intervention_file)
+    if not args.quick:
+        # Kick off both LLM-bound calls up front so their inference latency
+        # overlaps with each other and with the local tests; results are
+        # still displayed in order
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            detection_context, detection_activity, detection_future = (
+                start_off_task_detection(client, pool)
+            )
+            answer_question, answer_future = start_question_answering(client, pool)
+
+            # Test 2: Detection
+            results.append((
+                "Off-task Detection",
+                test_off_task_detection(detection_context, detection_activity, detection_future),
+            ))
+
+            # Test 3: File writing
+            results.append(("Intervention Writing", test_intervention_writing(intervention_file)))
+
+            # Test 4: Question detection
+            results.append(("Question Detection", test_question_detection()))
+
+            # Test 5: Question answering
+            results.append(("Question Answering", test_question_answering(answer_question, answer_future)))
+
+        # Test 6: Real scenario (interactive, so never in a pipe)
+        if not args.no_scenario and sys.stdin.isatty():
+            test_real_scenario(client, intervention_file)
 
     # Summary
     console.print("\n" + "="*60)